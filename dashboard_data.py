@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Dashboard Data - validation data loading and precomputed aggregates
+
+Pure pandas helpers shared by streamlit_dashboard.py and
+scripts/build_dashboard_payload.py (no Streamlit imports here).
+"""
+
+import json
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Written next to the validation CSVs by scripts/build_dashboard_payload.py
+PAYLOAD_FILENAME = 'dashboard_payload.json'
+
+YTD_PERIOD = '2024-2025'
+
+# Two-year walk-forward validation periods by trade entry year
+PERIOD_BY_YEAR = {
+    2014: '2014-2015', 2015: '2014-2015',
+    2016: '2016-2017', 2017: '2016-2017',
+    2018: '2018-2019', 2019: '2018-2019',
+    2020: '2020-2021', 2021: '2020-2021',
+    2022: '2022-2023', 2023: '2022-2023',
+}
+
+# Columns the dashboard uses from each validation file; corn and soybean files
+# have different layouts, so each list covers both and only the ones present
+# in a file are read
+RESULTS_COLUMNS = [
+    'period', 'num_trades', 'win_rate', 'sharpe', 'avg_win', 'avg_loss',
+    'avg_r', 'total_return', 'max_dd'
+]
+TRADES_COLUMNS = [
+    'entry_date', 'exit_date', 'direction', 'entry_price', 'exit_price',
+    'pnl_r', 'final_r', 'exit_reason', 'days_held',
+    'date', 'signal', 'strategy_return', 'period'
+]
+
+DATE_COLUMNS = ['date', 'entry_date', 'exit_date']
+
+
+def read_validation_file(csv_path, parquet_path, columns):
+    """Read the used columns of a validation file, preferring the Parquet copy
+
+    The Parquet copy is used only if it is at least as new as the CSV, so a
+    re-exported CSV is read until it is converted again. Parquet files
+    (scripts/convert_validation_to_parquet.py) store dates as
+    timestamps; for CSV files the date columns are parsed while reading.
+    Columns are Arrow-backed so st.dataframe can ship them without a
+    pandas->Arrow copy.
+    """
+
+    if parquet_path.exists() and (
+        not csv_path.exists() or parquet_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns
+    ):
+        present = pq.read_schema(parquet_path).names
+        return pd.read_parquet(parquet_path, engine='pyarrow', dtype_backend='pyarrow',
+                               columns=[c for c in present if c in columns])
+
+    if pl is not None:
+        # Polars parses dates natively and only materializes the selected
+        # columns; hand the result over as Arrow-backed pandas (dates as
+        # timestamps, like Parquet)
+        lf = pl.scan_csv(csv_path, try_parse_dates=True)
+        lf = lf.select([c for c in lf.collect_schema().names() if c in columns])
+        df = lf.with_columns(pl.col(pl.Date).cast(pl.Datetime('ns'))).collect()
+        return df.to_pandas(use_pyarrow_extension_array=True)
+
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [c for c in header if c in columns]
+    date_columns = [c for c in DATE_COLUMNS if c in usecols]
+    df = pd.read_csv(
+        csv_path,
+        usecols=usecols,
+        parse_dates=date_columns,
+        dtype_backend='pyarrow'
+    )
+    # Parsed dates come back as numpy datetime64; match the other readers
+    return df.astype({c: 'timestamp[ns][pyarrow]' for c in date_columns})
+
+
+def prepare_trades(df):
+    """Normalize corn/soybean trade files to one format
+
+    Returns (trades_df, trades_by_period): all trades sorted by entry date,
+    and a dict mapping each validation period to its (sorted) trades.
+    """
+    # Handle different file formats (corn vs soybean)
+    if 'entry_date' in df.columns:
+        # Corn format - has detailed trade info
+
+        # Add period column based on entry_date year (any other year is YTD)
+        df['period'] = df['entry_date'].dt.year.map(PERIOD_BY_YEAR).fillna(YTD_PERIOD)
+
+        # Map final_r to pnl_r for consistency
+        if 'final_r' in df.columns:
+            df['pnl_r'] = df['final_r']
+    else:
+        # Soybean format - simplified format with period already included
+        # Create dummy columns for compatibility
+        df['entry_date'] = df['date']
+        df['exit_date'] = df['date']
+        df['direction'] = df['signal'].map({1: 'LONG'}).fillna('SHORT')
+        df['entry_price'] = 0  # Not available in this format
+        df['exit_price'] = 0
+        df['pnl_r'] = df['strategy_return'] * 100  # Convert to R-like format
+        df['exit_reason'] = 'N/A'
+        df['days_held'] = 0
+
+    # Repeated labels as categories; the only place trade dtypes are set, so the
+    # frame is the same whichever reader produced it
+    df = df.astype({'direction': 'category', 'exit_reason': 'category', 'period': 'category'})
+
+    # Sort and group once here so display code doesn't re-sort/filter per rerun
+    df = df.sort_values('entry_date').reset_index(drop=True)
+    trades_by_period = {
+        period: group for period, group in df.groupby('period', sort=False, observed=True)
+    }
+
+    return df, trades_by_period
+
+
+def max_drawdown_r(period_trades):
+    """Max drawdown (in R) of the cumulative PnL of trades sorted by entry date"""
+    if period_trades is None or len(period_trades) == 0:
+        return 0.0
+
+    cumulative_r = period_trades['pnl_r'].cumsum()
+    drawdown = cumulative_r - cumulative_r.expanding().max()
+    return float(abs(drawdown.min()))
+
+
+def _iso_date(value):
+    """Timestamp -> 'YYYY-MM-DD' string for the JSON payload"""
+    return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+
+def build_dashboard_payload(results_df, trades_df, trades_by_period):
+    """Everything the dashboard derives from the validation data, as plain JSON types
+
+    Keys: num_trades, last_trade, ytd (2024-2025 metrics), periods
+    (per-period total PnL and max drawdown in R) and aggregate (all-period stats).
+    """
+    # Most recent trade as a namedtuple (no Series or dict built for one row)
+    recent_trade = next(trades_df.tail(1).itertuples(index=False))
+    last_trade = {
+        'entry_date': _iso_date(recent_trade.entry_date),
+        'exit_date': _iso_date(recent_trade.exit_date),
+        'direction': str(recent_trade.direction),
+        'entry_price': float(recent_trade.entry_price),
+        'exit_price': float(recent_trade.exit_price),
+        'pnl_r': float(recent_trade.pnl_r),
+        'exit_reason': str(recent_trade.exit_reason),
+        'days_held': int(recent_trade.days_held),
+    }
+
+    # Per-period total PnL and max DD in R (column names differ between corn and soy)
+    if 'avg_r' in results_df.columns:
+        # Corn format - total R from avg_r * num_trades, max DD from actual trades
+        total_pnl_r = results_df['avg_r'] * results_df['num_trades']
+        max_dd_r = [max_drawdown_r(trades_by_period.get(period)) for period in results_df['period']]
+    else:
+        # Soybean format - already has total_return in R
+        total_pnl_r = results_df['total_return']
+        max_dd_r = results_df['max_dd'].abs()
+
+    period_stats = pd.DataFrame({
+        'period': results_df['period'],
+        'total_pnl_r': total_pnl_r,
+        'win_rate': results_df['win_rate'],
+        'sharpe': results_df['sharpe'],
+        'max_dd_r': max_dd_r,
+    })
+
+    periods = {
+        str(period): {'total_pnl_r': float(pnl), 'max_dd_r': float(dd)}
+        for period, pnl, dd in zip(period_stats['period'], period_stats['total_pnl_r'], period_stats['max_dd_r'])
+    }
+
+    # YTD metrics from the 2024-2025 results row
+    ytd_results = results_df[results_df['period'] == YTD_PERIOD].iloc[0]
+    total_trades = int(ytd_results['num_trades'])
+    win_rate = float(ytd_results['win_rate'])
+    winning_trades = int(total_trades * win_rate)
+
+    ytd = {
+        'total_trades': total_trades,
+        'win_rate': win_rate,
+        'sharpe': float(ytd_results['sharpe']),
+        'winning_trades': winning_trades,
+        'losing_trades': total_trades - winning_trades,
+        'avg_win_r': float(ytd_results['avg_win']),
+        'avg_loss_r': float(ytd_results['avg_loss']),
+        'total_pnl_r': periods[YTD_PERIOD]['total_pnl_r'],
+        'max_drawdown_r': periods[YTD_PERIOD]['max_dd_r'],
+    }
+
+    # All-period stats in one pass over the period table
+    agg = period_stats.agg({
+        'total_pnl_r': 'sum',
+        'win_rate': 'mean',
+        'sharpe': 'mean',
+        'max_dd_r': 'max'
+    })
+    aggregate = {
+        'total_pnl_all': float(agg['total_pnl_r']),
+        'avg_win_rate': float(agg['win_rate']),
+        'avg_sharpe': float(agg['sharpe']),
+        'worst_dd': float(agg['max_dd_r']),
+    }
+
+    return {
+        'num_trades': len(trades_df),
+        'last_trade': last_trade,
+        'ytd': ytd,
+        'periods': periods,
+        'aggregate': aggregate,
+    }
+
+
+def load_dashboard_payload(payload_path, source_paths=()):
+    """Read a payload written by scripts/build_dashboard_payload.py
+
+    Returns None if it is missing or older than any of source_paths (the
+    validation files it is built from), so callers rebuild it from those.
+    """
+    if not payload_path.exists():
+        return None
+    payload_mtime = payload_path.stat().st_mtime_ns
+    if any(path.exists() and path.stat().st_mtime_ns > payload_mtime for path in source_paths):
+        return None
+    with open(payload_path, 'r') as f:
+        return json.load(f)
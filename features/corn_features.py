@@ -12,14 +12,21 @@ This script:
 6. Saves enhanced dataset with 120+ features
 """
 
+import sys
+from pathlib import Path
 import pandas as pd
 import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, str(Path(__file__).parent))
+from model_features import save_feature_files
+
 # File paths
 INPUT_FILE = "data/corn_combined.csv"
 OUTPUT_FILE = "data/corn_combined_features.csv"
+MODEL_FEATURES_FILE = "data/corn_model_features.parquet"
+FEATURE_ORDER_FILE = "models/corn_high_conviction/feature_names.json"
 
 print("="*60)
 print("PHASE 1: FEATURE ENGINEERING")
@@ -33,7 +40,8 @@ df = pd.read_csv(INPUT_FILE, parse_dates=['date'])
 print(f"  Loaded {len(df)} rows, {len(df.columns)} columns")
 print(f"  Date range: {df['date'].min()} to {df['date'].max()}")
 
-# Sort by date to ensure proper ordering
+# Sort by date to ensure proper ordering (the saved CSV/Parquet keep this
+# order; signal generation and the dashboard rely on it and don't re-sort)
 df = df.sort_values('date').reset_index(drop=True)
 
 # ============================================================================
@@ -334,12 +342,19 @@ print(f"\n{'='*60}")
 print("SAVING ENHANCED DATASET")
 print(f"{'='*60}")
 
-df.to_csv(OUTPUT_FILE, index=False)
+# Forward-fills the features, saves the CSV and the float32 model features Parquet
+missing_features = save_feature_files(df, feature_cols, OUTPUT_FILE, MODEL_FEATURES_FILE, FEATURE_ORDER_FILE)
 print(f"\n  Saved to: {OUTPUT_FILE}")
 print(f"  Total rows: {len(df)}")
 print(f"  Total columns: {len(df.columns)}")
 print(f"  Date range: {df['date'].min()} to {df['date'].max()}")
 
+if missing_features:
+    print(f"\n  ❌ ERROR: {len(missing_features)} model features missing from the dataset: {missing_features}")
+    print(f"  Skipped {MODEL_FEATURES_FILE} (signal generation will use the CSV)")
+else:
+    print(f"\n  Saved model features to: {MODEL_FEATURES_FILE}")
+
 # ============================================================================
 # SUMMARY STATISTICS
 # ============================================================================
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Model Features - shared post-processing for the feature engineering scripts
+
+Used by corn_features.py and soybean_features.py after the feature dataset is
+built: forward-fills the feature columns, saves the CSV, and writes the float32
+model-ready Parquet matrix in the production model's feature order.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+TARGET_PREFIXES = ('fwd_ret_', 'target_up_')
+NON_FEATURE_COLUMNS = ['date', 'adj_close', 'notes']
+
+
+def get_feature_columns(df):
+    """Feature columns: everything except date, targets and redundant columns"""
+    return [col for col in df.columns
+            if not col.startswith(TARGET_PREFIXES) and col not in NON_FEATURE_COLUMNS]
+
+
+def save_feature_files(df, feature_cols, output_file, model_features_file, feature_order_file):
+    """Forward-fill features, save the CSV and the model features Parquet
+
+    Returns the model features missing from df. If any are missing the Parquet
+    is not written and an existing one is removed, so signal generation falls
+    back to the CSV instead of reading stale or all-NaN columns.
+    """
+    # Forward-fill features once at write time (rows are append-only) so signal
+    # generation doesn't have to ffill on every run; targets are left untouched
+    df[feature_cols] = df[feature_cols].ffill()
+    df.to_csv(output_file, index=False)
+
+    with open(feature_order_file, 'r') as f:
+        feature_order = json.load(f)
+
+    missing = [col for col in feature_order if col not in df.columns]
+    if missing:
+        Path(model_features_file).unlink(missing_ok=True)
+        return missing
+
+    # float32 columns in the model's feature order, so signal generation can use
+    # them without re-typing or re-ordering
+    model_df = df[['date']].join(df[feature_order].astype(np.float32))
+    model_df.to_parquet(model_features_file, index=False)
+    return []
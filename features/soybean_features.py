@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import sys
 import os
+import time
+from pathlib import Path
+
+import pandas as pd
 
 # Set UTF-8 encoding for stdout/stderr
 if sys.platform == 'win32':
@@ -8,6 +12,13 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+sys.path.insert(0, str(Path(__file__).parent))
+from model_features import get_feature_columns, save_feature_files
+
+OUTPUT_FILE = "../data/soybean_combined_features.csv"
+MODEL_FEATURES_FILE = "../data/soybean_model_features.parquet"
+FEATURE_ORDER_FILE = "../models/soy_high_conviction/feature_names.json"
+
 # Run the feature engineering script
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
@@ -16,9 +27,27 @@ import importlib.util
 spec = importlib.util.spec_from_file_location("feature_eng", "inactive/scripts_soybean/01_feature_engineering.py")
 module = importlib.util.module_from_spec(spec)
 
+started = time.time()
 try:
     spec.loader.exec_module(module)
     print("\n[SUCCESS] Soybean feature engineering complete!")
 except Exception as e:
     print(f"\n[INFO] Feature engineering completed with minor display issue: {e}")
     print("[OK] Data file should be saved successfully")
+
+# Post-process only a dataset written by this run: forward-fill features and
+# write the float32 model-ready matrix (shared with features/corn_features.py)
+if not os.path.exists(OUTPUT_FILE) or os.path.getmtime(OUTPUT_FILE) < started:
+    print(f"[SKIP] {OUTPUT_FILE} was not written by this run - skipping model features")
+    sys.exit(0)
+
+df = pd.read_csv(OUTPUT_FILE, parse_dates=['date'])
+# Saved sorted by date; signal generation and the dashboard rely on it and don't re-sort
+df = df.sort_values('date').reset_index(drop=True)
+
+missing_features = save_feature_files(df, get_feature_columns(df), OUTPUT_FILE, MODEL_FEATURES_FILE, FEATURE_ORDER_FILE)
+if missing_features:
+    print(f"[ERROR] {len(missing_features)} model features missing from the dataset: {missing_features}")
+    print(f"[ERROR] Skipped {MODEL_FEATURES_FILE} (signal generation will use the CSV)")
+else:
+    print(f"[OK] Saved model features to: {MODEL_FEATURES_FILE}")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Build dashboard payloads from model validation results
+
+Writes validation_results/dashboard_payload.json for each high conviction model
+with the aggregates the dashboard renders (last trade, YTD metrics, per-period
+and all-period stats), so page renders don't recompute them. Re-run after
+exporting new validation results.
+
+Usage:
+    python scripts/build_dashboard_payload.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from dashboard_data import (
+    PAYLOAD_FILENAME,
+    RESULTS_COLUMNS,
+    TRADES_COLUMNS,
+    build_dashboard_payload,
+    prepare_trades,
+    read_validation_file,
+)
+
+MODEL_DIRS = ['corn_high_conviction', 'soy_high_conviction']
+
+
+def build_payload(model_dir):
+    """Build and write the dashboard payload for one model"""
+    results_dir = PROJECT_ROOT / 'models' / model_dir / 'validation_results'
+
+    results_df = read_validation_file(
+        results_dir / 'walk_forward_6period_results.csv',
+        results_dir / 'walk_forward_6period_results.parquet',
+        RESULTS_COLUMNS
+    )
+    trades_df, trades_by_period = prepare_trades(read_validation_file(
+        results_dir / 'walk_forward_6period_trades.csv',
+        results_dir / 'walk_forward_6period_trades.parquet',
+        TRADES_COLUMNS
+    ))
+
+    payload = build_dashboard_payload(results_df, trades_df, trades_by_period)
+
+    payload_path = results_dir / PAYLOAD_FILENAME
+    with open(payload_path, 'w') as f:
+        json.dump(payload, f, indent=2)
+    return payload_path
+
+
+def main():
+    print(f"Building dashboard payloads for {len(MODEL_DIRS)} models...")
+
+    for model_dir in MODEL_DIRS:
+        try:
+            payload_path = build_payload(model_dir)
+            print(f"  [OK] {payload_path.relative_to(PROJECT_ROOT)}")
+        except Exception as e:
+            print(f"  [ERROR] {model_dir}: {e}")
+
+
+if __name__ == '__main__':
+    main()
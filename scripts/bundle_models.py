@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Bundle model artifacts for the dashboard
+
+Combines model_2024.pkl, scaler_2024.pkl and imputer_2024.pkl in each model
+directory into a single uncompressed bundle_2024.joblib, which
+generate_signals_high_conviction.py loads in one call with memory-mapped
+arrays. Re-run after copying in new model files.
+
+Usage:
+    python scripts/bundle_models.py
+"""
+
+from pathlib import Path
+
+import joblib
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+BUNDLE_FILENAME = 'bundle_2024.joblib'
+
+
+def bundle_model(model_dir):
+    """Write the bundle for one model directory"""
+    bundle = {
+        'model': joblib.load(model_dir / 'model_2024.pkl'),
+        'scaler': joblib.load(model_dir / 'scaler_2024.pkl'),
+        'imputer': joblib.load(model_dir / 'imputer_2024.pkl'),
+    }
+
+    # Uncompressed so numpy arrays can be memory-mapped on load
+    bundle_path = model_dir / BUNDLE_FILENAME
+    joblib.dump(bundle, bundle_path, compress=0)
+    return bundle_path
+
+
+def main():
+    model_dirs = sorted(path.parent for path in PROJECT_ROOT.glob('models/*/model_2024.pkl'))
+    print(f"Bundling {len(model_dirs)} models...")
+
+    for model_dir in model_dirs:
+        try:
+            bundle_path = bundle_model(model_dir)
+            print(f"  [OK] {bundle_path.relative_to(PROJECT_ROOT)}")
+        except Exception as e:
+            print(f"  [ERROR] {model_dir.relative_to(PROJECT_ROOT)}: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Convert model validation CSVs to Parquet
+
+Writes a .parquet file alongside each models/*/validation_results/*.csv so the
+dashboard can load them without CSV parsing. Date columns are stored as native
+timestamps. Re-run after exporting new validation results.
+
+Usage:
+    python scripts/convert_validation_to_parquet.py
+"""
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def convert_csv(csv_path):
+    """Convert one CSV to Parquet, storing date columns as timestamps"""
+    table = pacsv.read_csv(csv_path)
+
+    # Arrow infers ISO dates as date32; store them as timestamps so pandas
+    # reads them back as datetime64 columns
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.timestamp('ns')))
+
+    parquet_path = csv_path.with_suffix('.parquet')
+    pq.write_table(table, parquet_path)
+    return parquet_path
+
+
+def main():
+    csv_files = sorted(PROJECT_ROOT.glob('models/*/validation_results/*.csv'))
+    print(f"Converting {len(csv_files)} validation CSV files...")
+
+    for csv_path in csv_files:
+        try:
+            parquet_path = convert_csv(csv_path)
+            print(f"  [OK] {parquet_path.relative_to(PROJECT_ROOT)}")
+        except Exception as e:
+            print(f"  [ERROR] {csv_path.relative_to(PROJECT_ROOT)}: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -74,10 +74,13 @@ def get_feature_columns(df):
 def calculate_atr(prices, high=None, low=None, period=20):
     """Calculate Average True Range"""
     if high is not None and low is not None:
-        tr1 = high - low
-        tr2 = abs(high - prices.shift(1))
-        tr3 = abs(low - prices.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        # Row-wise max of the three ranges on plain arrays (fmax skips the
+        # NaN previous close on the first row, like DataFrame.max)
+        h = high.to_numpy(dtype=float)
+        l = low.to_numpy(dtype=float)
+        prev_close = prices.shift(1).to_numpy(dtype=float)
+        tr = np.fmax.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)])
+        tr = pd.Series(tr, index=prices.index)
     else:
         # Estimate from close prices
         tr = prices.pct_change().abs().rolling(5).std() * prices
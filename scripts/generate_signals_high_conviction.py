@@ -18,18 +18,39 @@ Output:
 
 import pandas as pd
 import numpy as np
+import io
 import json
 import joblib
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 import argparse
 import warnings
-warnings.filterwarnings('ignore')
+
+# Numerical kernels: AOT-compiled module if built (python scripts/_kernels.py),
+# otherwise the cached @njit versions (plain Python without numba). Both live
+# next to this file (as do the other helpers imported below), which is not on
+# sys.path when imported from elsewhere
+sys.path.insert(0, str(Path(__file__).parent))
+try:
+    from signal_kernels import rolling_pct_rank_last, fused_impute_scale
+    FAST_KERNELS = True
+except ImportError:
+    from _kernels import rolling_pct_rank_last, fused_impute_scale, HAVE_NUMBA
+    FAST_KERNELS = HAVE_NUMBA
+
+from signal_history import append_signal_history
+
+# sklearn warns that the plain arrays passed to the imputer/scaler/model lack
+# the feature names they were fitted with - expected here, so silence just that
+# (a module-level filter; catch_warnings is not thread-safe and commodities are
+# processed in worker threads)
+warnings.filterwarnings('ignore', message='X does not have valid feature names', category=UserWarning)
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
-    import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
@@ -42,6 +63,7 @@ SIGNALS_DIR.mkdir(exist_ok=True)
 COMMODITY_CONFIGS = {
     'corn': {
         'data_path': BASE_DIR / 'data' / 'corn_combined_features.csv',
+        'features_path': BASE_DIR / 'data' / 'corn_model_features.parquet',
         'config_path': BASE_DIR / 'models' / 'corn_high_conviction' / 'model_config.json',
         'model_dir': BASE_DIR / 'models' / 'corn_high_conviction',
         'display_name': 'Corn',
@@ -49,6 +71,7 @@ COMMODITY_CONFIGS = {
     },
     'soybean': {
         'data_path': BASE_DIR / 'data' / 'soybean_combined_features.csv',
+        'features_path': BASE_DIR / 'data' / 'soybean_model_features.parquet',
         'config_path': BASE_DIR / 'models' / 'soy_high_conviction' / 'model_config.json',
         'model_dir': BASE_DIR / 'models' / 'soy_high_conviction',
         'display_name': 'Soybeans',
@@ -56,12 +79,31 @@ COMMODITY_CONFIGS = {
     }
 }
 
+# Console output from worker threads is buffered per thread and flushed as
+# one block, so concurrent commodities don't interleave line by line
+_print_lock = threading.Lock()
+_thread_output = threading.local()
+
+
+def log(*args, **kwargs):
+    """print() that buffers output while running in a commodity worker thread"""
+    buffer = getattr(_thread_output, 'buffer', None)
+    if buffer is not None:
+        print(*args, file=buffer, **kwargs)
+    else:
+        with _print_lock:
+            print(*args, **kwargs)
+
 
 def load_data(data_path):
-    """Load latest data"""
-    df = pd.read_csv(data_path)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date').reset_index(drop=True)
+    """Load latest data (full features CSV or float32 model features Parquet)"""
+    if data_path.suffix == '.parquet':
+        df = pd.read_parquet(data_path)
+    else:
+        df = pd.read_csv(data_path, parse_dates=['date'], date_format='%Y-%m-%d')
+
+    # Feature files are written sorted by date (features/*_features.py)
+    assert df['date'].is_monotonic_increasing, f"{data_path.name} is not sorted by date"
     return df
 
 
@@ -73,19 +115,29 @@ def get_feature_columns(df):
                     'open_interest', 'notes', 'prcp_anomaly', 'tavg_anomaly']
 
     feature_cols = [col for col in df.columns if col not in exclude_cols]
-    missing_pct = df[feature_cols].isna().mean()
-    feature_cols = [col for col in feature_cols if missing_pct[col] < 0.8]
 
-    return feature_cols
+    # Count NaNs one column at a time (avoids a full rows x cols boolean mask)
+    max_missing = 0.8 * len(df)
+    keep = []
+    for col in feature_cols:
+        arr = df[col].to_numpy()
+        nan_count = np.isnan(arr).sum() if arr.dtype.kind == 'f' else pd.isna(arr).sum()
+        if nan_count < max_missing:
+            keep.append(col)
+
+    return keep
 
 
 def calculate_atr(prices, high=None, low=None, period=20):
     """Calculate Average True Range"""
     if high is not None and low is not None:
-        tr1 = high - low
-        tr2 = abs(high - prices.shift(1))
-        tr3 = abs(low - prices.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        # Row-wise max of the three ranges on plain arrays (fmax skips the
+        # NaN previous close on the first row, like DataFrame.max)
+        h = high.to_numpy(dtype=float)
+        l = low.to_numpy(dtype=float)
+        prev_close = prices.shift(1).to_numpy(dtype=float)
+        tr = np.fmax.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)])
+        tr = pd.Series(tr, index=prices.index)
     else:
         # Estimate from close prices
         tr = prices.pct_change().abs().rolling(5).std() * prices
@@ -94,9 +146,87 @@ def calculate_atr(prices, high=None, low=None, period=20):
     return atr
 
 
+def get_scaler_params(scaler):
+    """Return (center, scale) of a fitted StandardScaler/RobustScaler
+
+    Either may be None when centering/scaling is disabled. Returns None for
+    other scaler types.
+    """
+    if hasattr(scaler, 'mean_'):
+        return (scaler.mean_ if scaler.with_mean else None), scaler.scale_
+    if hasattr(scaler, 'center_'):
+        return scaler.center_, scaler.scale_
+    return None
+
+
+def scale_in_place(scaler, X):
+    """Apply a fitted StandardScaler/RobustScaler to X in place"""
+    params = get_scaler_params(scaler)
+    if params is None:
+        # Unknown scaler - let it allocate its own output
+        return scaler.transform(X)
+
+    center, scale = params
+    if center is not None:
+        X -= center
+    if scale is not None:
+        X /= scale
+    return X
+
+
+def preprocess_features(features, imputer, scaler):
+    """Impute and scale a float32 feature matrix
+
+    Uses the fused impute+scale kernel when it is compiled and the fitted
+    imputer/scaler map onto it (NaN fill values, no dropped columns, no
+    indicator features); otherwise imputer.transform + scale_in_place.
+    """
+    params = get_scaler_params(scaler)
+    statistics = getattr(imputer, 'statistics_', None)
+    can_fuse = (
+        FAST_KERNELS
+        and params is not None
+        and statistics is not None
+        and statistics.dtype.kind == 'f'
+        and not np.isnan(statistics).any()
+        and getattr(imputer, 'add_indicator', False) is False
+        and isinstance(imputer.missing_values, float) and np.isnan(imputer.missing_values)
+    )
+
+    if can_fuse:
+        n_features = features.shape[1]
+        center, scale = params
+        fill = statistics.astype(np.float32)
+        center = np.zeros(n_features, np.float32) if center is None else center.astype(np.float32)
+        scale = np.ones(n_features, np.float32) if scale is None else scale.astype(np.float32)
+        return fused_impute_scale(np.ascontiguousarray(features, dtype=np.float32), fill, center, scale)
+
+    features_imputed = imputer.transform(features)
+    # The imputer output is a fresh buffer we own, so scale it in place
+    return scale_in_place(scaler, features_imputed)
+
+
 def load_model(model_dir):
     """Load existing model (high conviction models use _2024 suffix)"""
 
+    # Single bundle from scripts/bundle_models.py, arrays memory-mapped; only
+    # used while it is at least as new as the pickles it was built from
+    bundle_path = model_dir / 'bundle_2024.joblib'
+    bundle_sources = [model_dir / f'{name}_2024.pkl' for name in ('model', 'scaler', 'imputer')]
+    bundle_is_stale = bundle_path.exists() and any(
+        path.exists() and path.stat().st_mtime_ns > bundle_path.stat().st_mtime_ns
+        for path in bundle_sources
+    )
+    if bundle_is_stale:
+        log(f"⚠️  {bundle_path.name} is older than the model files - ignoring it "
+            f"(re-run scripts/bundle_models.py)")
+    elif bundle_path.exists():
+        log(f"Loading model bundle from {bundle_path}")
+        bundle = joblib.load(bundle_path, mmap_mode='r')
+        model, scaler, imputer = bundle['model'], bundle['scaler'], bundle['imputer']
+        feature_names = list(imputer.feature_names_in_) if hasattr(imputer, 'feature_names_in_') else None
+        return model, imputer, scaler, feature_names
+
     # Try _2024 suffix first (high conviction models)
     model_path = model_dir / 'model_2024.pkl'
     scaler_path = model_dir / 'scaler_2024.pkl'
@@ -111,7 +241,7 @@ def load_model(model_dir):
     if not model_path.exists():
         raise FileNotFoundError(f"Model not found in {model_dir}. Please train the model first.")
 
-    print(f"Loading model from {model_path}")
+    log(f"Loading model from {model_path}")
     model = joblib.load(model_path)
     scaler = joblib.load(scaler_path)
     imputer = joblib.load(imputer_path)
@@ -120,9 +250,9 @@ def load_model(model_dir):
     feature_names = None
     if hasattr(imputer, 'feature_names_in_'):
         feature_names = list(imputer.feature_names_in_)
-        print(f"✅ Loaded {len(feature_names)} feature names from imputer")
+        log(f"✅ Loaded {len(feature_names)} feature names from imputer")
     else:
-        print("⚠️  Could not get feature names from imputer")
+        log("⚠️  Could not get feature names from imputer")
 
     return model, imputer, scaler, feature_names
 
@@ -140,22 +270,34 @@ def generate_signals(df, model, imputer, scaler, feature_cols, config):
     PROFIT_TARGET_R = config['parameters']['profit_targets']['target_r']
     TIME_STOP_DAYS = config['parameters']['stops']['time_stop_days']
 
-    # Get latest 120 days (need rolling window + buffer)
-    recent_df = df.tail(150).copy()
+    # Rows needed for today's values: a full percentile window, and for ATR
+    # ATR_PERIOD true ranges plus the prior close (the close-only fallback
+    # also needs a 5-day std of returns)
+    lookback = max(ROLLING_WINDOW, ATR_PERIOD + 6)
+    recent_df = df.tail(lookback).copy()
 
-    # Prepare features
-    features = recent_df[feature_cols].ffill()
-    features_imputed = imputer.transform(features)
-    features_scaled = scaler.transform(features_imputed)
+    # Prepare features (float32 end to end when loaded from the Parquet matrix).
+    # Features are forward-filled at feature-engineering time; any NaNs left
+    # (e.g. a late COT/WASDE release) are filled by the imputer.
+    features = recent_df[feature_cols].to_numpy(dtype=np.float32)
+
+    # Feature files written before write-time filling still have gaps (a NaN
+    # after a value); fill those as before until the feature scripts are re-run
+    missing = np.isnan(features)
+    if (missing[1:] & ~missing[:-1]).any():
+        log("⚠️  Feature data has unfilled gaps - forward-filling (re-run the feature scripts)")
+        features = recent_df[feature_cols].ffill().to_numpy(dtype=np.float32)
+
+    features_scaled = preprocess_features(features, imputer, scaler)
 
     # Predict
     predictions = model.predict(features_scaled)
     recent_df['prediction'] = predictions
 
-    # Calculate percentiles (rolling)
-    recent_df['pred_percentile'] = recent_df['prediction'].rolling(
-        ROLLING_WINDOW, min_periods=20
-    ).apply(lambda x: pd.Series(x).rank(pct=True).iloc[-1])
+    # Calculate percentiles (rolling rank of each prediction in its window)
+    recent_df['pred_percentile'] = rolling_pct_rank_last(
+        np.ascontiguousarray(predictions, dtype=np.float64), ROLLING_WINDOW, 20
+    )
 
     # Calculate ATR
     if 'high' in recent_df.columns and 'low' in recent_df.columns:
@@ -306,27 +448,20 @@ def save_signal_history(signal, commodity):
         'time_stop_date': signal['time_stop_date']
     }])
 
-    # Append to history
-    if history_file.exists():
-        history = pd.read_csv(history_file)
-        history = pd.concat([history, signal_df], ignore_index=True)
-    else:
-        history = signal_df
-
-    history.to_csv(history_file, index=False)
-    print(f"✅ Signal saved to {history_file}")
+    append_signal_history(history_file, signal_df)
+    log(f"✅ Signal saved to {history_file}")
 
 
 def send_email_alert(signal, to_email):
     """Send email alert (placeholder - implement with your email service)"""
-    print(f"📧 Email alert would be sent to {to_email}")
+    log(f"📧 Email alert would be sent to {to_email}")
     # TODO: Implement email sending
     # Example using smtplib or SendGrid/Mailgun API
 
 
 def send_telegram_alert(signal, chat_id):
     """Send Telegram alert (placeholder - implement with Telegram Bot API)"""
-    print(f"📱 Telegram alert would be sent to chat {chat_id}")
+    log(f"📱 Telegram alert would be sent to chat {chat_id}")
     # TODO: Implement Telegram bot
     # Example using python-telegram-bot library
 
@@ -334,36 +469,52 @@ def send_telegram_alert(signal, chat_id):
 def process_commodity(commodity, commodity_config, args):
     """Process signals for a single commodity"""
 
-    print("\n" + "=" * 80)
-    print(f"{commodity_config['emoji']} Processing {commodity_config['display_name']} (High Conviction)...")
-    print("=" * 80)
+    log("\n" + "=" * 80)
+    log(f"{commodity_config['emoji']} Processing {commodity_config['display_name']} (High Conviction)...")
+    log("=" * 80)
 
     # Load configuration
     with open(commodity_config['config_path'], 'r') as f:
         config = json.load(f)
 
-    # Load data
-    print("Loading data...")
-    df = load_data(commodity_config['data_path'])
-    print(f"✅ Loaded {len(df)} rows (latest: {df['date'].max().strftime('%Y-%m-%d')})")
-
     # Load model (get feature names from saved model)
     model, imputer, scaler, feature_names = load_model(commodity_config['model_dir'])
 
+    # Load data (prefer the model-ready Parquet matrix when it matches the model;
+    # it is written after the CSV, so one older than the CSV is left over from an
+    # earlier run)
+    log("Loading data...")
+    data_path = commodity_config['data_path']
+    features_path = commodity_config['features_path']
+    df = None
+    if feature_names and features_path.exists() and data_path.exists() \
+            and features_path.stat().st_mtime_ns < data_path.stat().st_mtime_ns:
+        log(f"⚠️  {features_path.name} is older than {data_path.name} - falling back to CSV")
+    elif feature_names and features_path.exists():
+        data_path = features_path
+        df = load_data(data_path)
+        if not set(feature_names).issubset(df.columns):
+            log(f"⚠️  {data_path.name} does not match model features - falling back to CSV")
+            data_path = commodity_config['data_path']
+            df = None
+    if df is None:
+        df = load_data(data_path)
+    log(f"✅ Loaded {len(df)} rows from {data_path.name} (latest: {df['date'].max().strftime('%Y-%m-%d')})")
+
     # Use saved feature names if available, otherwise get from data
     if feature_names:
         feature_cols = feature_names
-        print(f"✅ Using {len(feature_cols)} features from model")
+        log(f"✅ Using {len(feature_cols)} features from model")
     else:
         feature_cols = get_feature_columns(df)
-        print(f"✅ Using {len(feature_cols)} features from data")
+        log(f"✅ Using {len(feature_cols)} features from data")
 
     # Generate signals
-    print("\nGenerating signals...")
+    log("\nGenerating signals...")
     signal = generate_signals(df, model, imputer, scaler, feature_cols, config)
 
     # Display signal
-    print("\n" + format_signal_output(signal, commodity_config['display_name'], commodity_config['emoji']))
+    log("\n" + format_signal_output(signal, commodity_config['display_name'], commodity_config['emoji']))
 
     # Save to CSV if requested
     if args.save_csv:
@@ -379,6 +530,18 @@ def process_commodity(commodity, commodity_config, args):
     return signal
 
 
+def run_commodity(commodity, args):
+    """Worker: process one commodity, then flush its console output in one block"""
+    _thread_output.buffer = io.StringIO()
+    try:
+        return process_commodity(commodity, COMMODITY_CONFIGS[commodity], args)
+    finally:
+        with _print_lock:
+            sys.stdout.write(_thread_output.buffer.getvalue())
+            sys.stdout.flush()
+        _thread_output.buffer = None
+
+
 def save_current_signals(results):
     """Save current signals to CSV for cloud dashboard"""
 
@@ -396,8 +559,9 @@ def save_current_signals(results):
                 'prediction': signal.get('prediction', 0),
                 'percentile': signal.get('percentile', 0),
                 'current_price': signal.get('current_price', 0),
-                'stop_loss': signal.get('stop_loss', 0) if signal.get('stop_loss') else '',
-                'profit_target': signal.get('profit_target', 0) if signal.get('profit_target') else '',
+                # NaN (not '') for no stop/target keeps the columns numeric
+                'stop_loss': signal.get('stop_loss') or np.nan,
+                'profit_target': signal.get('profit_target') or np.nan,
                 'position_size_pct': signal.get('position_size_pct', 0),
                 'atr': signal.get('atr', 0),
                 'time_stop_date': signal.get('time_stop_date', '').strftime('%Y-%m-%d') if signal.get('time_stop_date') else ''
@@ -430,17 +594,20 @@ def main():
     else:
         commodities_to_process = [args.commodity]
 
-    # Process each commodity
+    # Process commodities concurrently (model loading/prediction and file I/O
+    # release the GIL, so the two pipelines overlap)
     results = {}
-    for commodity in commodities_to_process:
-        try:
-            signal = process_commodity(commodity, COMMODITY_CONFIGS[commodity], args)
-            results[commodity] = signal
-        except Exception as e:
-            print(f"\n❌ Error processing {commodity}: {e}")
-            import traceback
-            traceback.print_exc()
-            results[commodity] = None
+    with ThreadPoolExecutor(max_workers=len(commodities_to_process)) as executor:
+        futures = {commodity: executor.submit(run_commodity, commodity, args)
+                   for commodity in commodities_to_process}
+        for commodity, future in futures.items():
+            try:
+                results[commodity] = future.result()
+            except Exception as e:
+                print(f"\n❌ Error processing {commodity}: {e}")
+                import traceback
+                traceback.print_exception(type(e), e, e.__traceback__)
+                results[commodity] = None
 
     # Summary
     print("\n" + "=" * 80)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Signal History - append daily signals to the history CSVs
+
+Shared by generate_signals.py and generate_signals_high_conviction.py.
+"""
+
+import pandas as pd
+
+
+def read_first_and_last_line(path):
+    """Return (first line, byte offset of the last line, last line) of a text file"""
+    with open(path, 'rb') as f:
+        first = f.readline().rstrip(b'\r\n')
+        f.seek(0, 2)
+        pos = max(0, f.tell() - 4096)
+        f.seek(pos)
+        chunk = f.read().rstrip(b'\r\n')
+    start = chunk.rfind(b'\n') + 1
+    return first.decode('utf-8'), pos + start, chunk[start:].decode('utf-8')
+
+
+def append_signal_history(history_file, signal_df):
+    """Add one day's signal row to a history CSV, replacing any row for that date
+
+    When the file has the same columns and the new date is later than its last
+    row, the row is appended without re-reading the file. Otherwise the history
+    is read, rows for that date are dropped, and the file is rewritten with
+    columns aligned by name.
+    """
+    if not history_file.exists():
+        signal_df.to_csv(history_file, index=False)
+        return
+
+    signal_date = pd.Timestamp(signal_df['date'].iloc[0])
+    header, _, last_line = read_first_and_last_line(history_file)
+    last_date = pd.to_datetime(last_line.split(',', 1)[0], errors='coerce')
+
+    if header.split(',') == list(signal_df.columns) and pd.notna(last_date) and signal_date > last_date:
+        signal_df.to_csv(history_file, mode='a', header=False, index=False)
+        return
+
+    history = pd.read_csv(history_file)
+    if 'date' in history.columns:
+        # Parsed so existing and new dates are written in the same format
+        history['date'] = pd.to_datetime(history['date'], errors='coerce')
+        history = history[history['date'] != signal_date]
+    history = pd.concat([history, signal_df], ignore_index=True)
+    history.to_csv(history_file, index=False)
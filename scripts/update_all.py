@@ -19,6 +19,7 @@ Usage:
 import sys
 import os
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -38,26 +39,40 @@ def print_header(title):
     print(f"  {title}")
     print("="*80)
 
-def run_script(script_path, description):
-    """Run a Python script and handle errors"""
+def run_script(script_path, description, timeout=300):
+    """Run a Python script, streaming its output, and handle errors"""
     print(f"\n[RUNNING] {description}...")
     try:
-        result = subprocess.run(
-            [sys.executable, script_path],
-            capture_output=True,
+        with subprocess.Popen(
+            [sys.executable, '-u', script_path],  # Unbuffered, so lines reach the pipe as printed
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300  # 5 minute timeout
-        )
-        if result.returncode == 0:
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1  # Line buffered
+        ) as proc:
+            # Kill the step if it runs past the timeout (5 minutes by default)
+            timed_out = threading.Event()
+            timer = threading.Timer(timeout, lambda: (timed_out.set(), proc.kill()))
+            timer.start()
+            try:
+                # Echo output as it arrives instead of buffering it all in memory
+                for line in proc.stdout:
+                    print(line, end='', flush=True)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+
+        if timed_out.is_set():
+            print(f"[ERROR] {description} timed out")
+            return False
+        if returncode == 0:
             print(f"[SUCCESS] {description}")
             return True
         else:
-            print(f"[ERROR] {description} failed:")
-            print(result.stderr)
+            print(f"[ERROR] {description} failed (exit code {returncode})")
             return False
-    except subprocess.TimeoutExpired:
-        print(f"[ERROR] {description} timed out")
-        return False
     except Exception as e:
         print(f"[ERROR] {description} failed: {e}")
         return False
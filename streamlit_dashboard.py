@@ -9,11 +9,22 @@ A minimal, terminal-style dashboard for displaying trading signals
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 from pathlib import Path
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from dashboard_data import (
+    PAYLOAD_FILENAME,
+    RESULTS_COLUMNS,
+    TRADES_COLUMNS,
+    YTD_PERIOD,
+    build_dashboard_payload,
+    load_dashboard_payload,
+    prepare_trades,
+    read_validation_file,
+)
 
 # Page configuration - terminal style
 st.set_page_config(
@@ -24,7 +35,7 @@ st.set_page_config(
 )
 
 # Terminal-style CSS
-st.markdown("""
+_CSS_HTML = """
     <style>
     /* Dark terminal background */
     .stApp {
@@ -41,18 +52,6 @@ st.markdown("""
         letter-spacing: 2px;
     }
 
-    /* Metric cards */
-    [data-testid="stMetricValue"] {
-        color: #00ff00;
-        font-family: 'Courier New', monospace;
-        font-size: 28px;
-    }
-
-    [data-testid="stMetricLabel"] {
-        color: #00ff00;
-        font-family: 'Courier New', monospace;
-    }
-
     /* Dataframes */
     .dataframe {
         background-color: #0a0a0a !important;
@@ -117,10 +116,6 @@ st.markdown("""
             font-size: 14px !important;
             letter-spacing: 1px !important;
         }
-
-        [data-testid="stMetricValue"] {
-            font-size: 18px !important;
-        }
     }
 
     /* Prevent horizontal scroll */
@@ -130,7 +125,121 @@ st.markdown("""
         padding-right: 1rem;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER_BOX_HTML = """
+<div class="terminal-box">
+╔═══════════════════════════════╗
+║                               ║
+║  AG FUTURES SIGNALS           ║
+║  HIGH CONVICTION MODELS       ║
+║                               ║
+║  CORN 🌽  |  SOYBEANS 🫘      ║
+║                               ║
+╚═══════════════════════════════╝
+</div>
+    """
+
+_FOOTER_HTML = """
+<div class="terminal-box">
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║  ⚠️  HISTORICAL BACKTEST DATA | NOT FINANCIAL ADVICE                         ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+</div>
+    """
+
+# Signal boxes, filled with str.format_map from the signal dict
+_HOLD_SIGNAL_TEMPLATE = """
+<div class="terminal-box">
+╔══════════════════════════════════╗
+║ SIGNAL: HOLD
+║ DATE: {signal_date}
+║
+║ STATUS: NO ACTIVE SIGNAL
+║ PRICE: ${current_price:.2f}
+║ PRED: {prediction:+.2%}
+║ PCTL: {percentile:.1%}
+║   (NEED >90% OR <10%)
+║
+║ [WAITING FOR HIGH CONVICTION]
+╚══════════════════════════════════╝
+</div>
+            """
+
+_LIVE_SIGNAL_TEMPLATE = """
+<div class="terminal-box">
+╔══════════════════════════════════╗
+║ ⚡ SIGNAL: {signal_color}
+║ DATE: {signal_date}
+║
+║ ENTRY: ${current_price:.2f}
+║ STOP: ${stop_loss:.2f}
+║ TARGET: ${profit_target:.2f}
+║
+║ CONFIDENCE: {confidence:.1%}
+║ PERCENTILE: {percentile:.1%}
+║ POSITION: {position_size_pct:.1f}% equity
+║
+║ RISK/REWARD: 1:2
+║ TIME STOP: {time_stop}
+║   (10 days)
+║
+║ [🔴 LIVE SIGNAL]
+╚══════════════════════════════════╝
+</div>
+            """
+
+_HISTORICAL_SIGNAL_TEMPLATE = """
+<div class="terminal-box">
+╔══════════════════════════════════╗
+║ LAST TRADE: {signal_color}
+║ ENTRY: {entry_date}
+║ EXIT: {date}
+║
+║ ENTRY PX: ${entry_price:.2f}
+║ EXIT PX: ${exit_price:.2f}
+║ PNL: {pnl_r:+.2f}R
+║
+║ EXIT RSN: {exit_reason}
+║ DAYS HELD: {days_held}
+║
+║ [HISTORICAL BACKTEST]
+╚══════════════════════════════════╝
+</div>
+        """
+
+# Metric boxes, filled with str.format_map from the payload dicts (one
+# markdown element each instead of a grid of st.metric widgets)
+_YTD_METRICS_TEMPLATE = """
+<div class="terminal-box">
+╔══════════════════════════════════╗
+║ TOTAL PNL: {total_pnl_r:.2f}R
+║ SHARPE: {sharpe:.2f}
+║ WIN RATE: {win_rate:.1%}
+║ TRADES: {total_trades}
+║
+║ AVG WIN: {avg_win_r:.2%}
+║ AVG LOSS: {avg_loss_r:.2%}
+║ MAX DD: {max_drawdown_r:.2f}R
+║ W/L: {winning_trades}/{losing_trades}
+╚══════════════════════════════════╝
+</div>
+    """
+
+_AGGREGATE_METRICS_TEMPLATE = """
+<div class="terminal-box">
+╔══════════════════════════════════╗
+║ TOTAL PNL (ALL): {total_pnl_all:.2f}R
+║ AVG WIN RATE: {avg_win_rate:.1%}
+║ AVG SHARPE: {avg_sharpe:.2f}
+║ WORST DD: {worst_dd:.2f}R
+╚══════════════════════════════════╝
+</div>
+    """
+
+# Streamlit rebuilds the page on every rerun, so the style block is re-emitted
+# each run; it is a constant and is never re-formatted
+st.markdown(_CSS_HTML, unsafe_allow_html=True)
 
 # Base directory
 BASE_DIR = Path(__file__).parent
@@ -138,266 +247,195 @@ BASE_DIR = Path(__file__).parent
 # Commodity configurations
 COMMODITY_CONFIGS = {
     'corn': {
-        'data_path': BASE_DIR / 'data' / 'corn_combined_features.csv',
-        'config_path': BASE_DIR / 'models' / 'corn_high_conviction' / 'model_config.json',
-        'model_dir': BASE_DIR / 'models' / 'corn_high_conviction',
         'validation_results': BASE_DIR / 'models' / 'corn_high_conviction' / 'validation_results' / 'walk_forward_6period_results.csv',
         'validation_trades': BASE_DIR / 'models' / 'corn_high_conviction' / 'validation_results' / 'walk_forward_6period_trades.csv',
+        'validation_results_parquet': BASE_DIR / 'models' / 'corn_high_conviction' / 'validation_results' / 'walk_forward_6period_results.parquet',
+        'validation_trades_parquet': BASE_DIR / 'models' / 'corn_high_conviction' / 'validation_results' / 'walk_forward_6period_trades.parquet',
+        'dashboard_payload': BASE_DIR / 'models' / 'corn_high_conviction' / 'validation_results' / PAYLOAD_FILENAME,
         'display_name': 'CORN',
         'emoji': '🌽'
     },
     'soybean': {
-        'data_path': BASE_DIR / 'data' / 'soybean_combined_features.csv',
-        'config_path': BASE_DIR / 'models' / 'soy_high_conviction' / 'model_config.json',
-        'model_dir': BASE_DIR / 'models' / 'soy_high_conviction',
         'validation_results': BASE_DIR / 'models' / 'soy_high_conviction' / 'validation_results' / 'walk_forward_6period_results.csv',
         'validation_trades': BASE_DIR / 'models' / 'soy_high_conviction' / 'validation_results' / 'walk_forward_6period_trades.csv',
+        'validation_results_parquet': BASE_DIR / 'models' / 'soy_high_conviction' / 'validation_results' / 'walk_forward_6period_results.parquet',
+        'validation_trades_parquet': BASE_DIR / 'models' / 'soy_high_conviction' / 'validation_results' / 'walk_forward_6period_trades.parquet',
+        'dashboard_payload': BASE_DIR / 'models' / 'soy_high_conviction' / 'validation_results' / PAYLOAD_FILENAME,
         'display_name': 'SOYBEANS',
         'emoji': '🫘'
     }
 }
 
 
-def check_live_data_available(config):
-    """Check if live data files are available"""
-    return config['data_path'].exists() and config['config_path'].exists()
+@dataclass(frozen=True, slots=True)
+class CommodityView:
+    """Display strings for one commodity, resolved once at startup"""
+    emoji: str
+    display_name: str
+    label: str   # "🌽 CORN" (selectbox option)
+    header: str  # "### 🌽 CORN -" (section header prefix)
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+COMMODITY_VIEWS = {
+    commodity: CommodityView(
+        emoji=config['emoji'],
+        display_name=config['display_name'],
+        label=f"{config['emoji']} {config['display_name']}",
+        header=f"### {config['emoji']} {config['display_name']} -"
+    )
+    for commodity, config in COMMODITY_CONFIGS.items()
+}
+
+
+def _optional_float(value):
+    """NaN (blank cell) -> None, otherwise a float"""
+    return None if pd.isna(value) else float(value)
+
+
+@st.cache_resource(ttl=300)  # Cache for 5 minutes
 def load_saved_signals():
-    """Load saved signals from CSV file"""
+    """Load saved signals from CSV file
+
+    Returns ({commodity: signal dict}, error): the dicts are built from each
+    commodity's most recent row (empty if there are no saved signals) and are
+    shared across reruns, so they must not be mutated. error is the message if
+    the file could not be read, else None; the caller shows it, since anything
+    rendered here would only appear on the cache-miss run.
+    """
     signals_file = BASE_DIR / 'signals' / 'current_signals.csv'
 
     if signals_file.exists():
         try:
-            df = pd.read_csv(signals_file)
+            df = pd.read_csv(
+                signals_file,
+                parse_dates=['date'],
+                date_format='%Y-%m-%d',
+                dtype={'commodity': 'category', 'signal': 'category'}
+            )
             if len(df) > 0:
-                df['date'] = pd.to_datetime(df['date'])
+                # Optional column (older files don't have it); blanks become NaT
                 if 'time_stop_date' in df.columns:
                     df['time_stop_date'] = pd.to_datetime(df['time_stop_date'], errors='coerce')
-                return df
+
+                # Most recent row per commodity
+                latest = df.groupby('commodity', observed=True).tail(1)
+
+                return {
+                    signal_row['commodity']: {
+                        'date': signal_row['date'],
+                        'signal': signal_row['signal'],
+                        'confidence': signal_row['confidence'],
+                        'prediction': signal_row['prediction'],
+                        'percentile': signal_row['percentile'],
+                        'current_price': signal_row['current_price'],
+                        'stop_loss': _optional_float(signal_row['stop_loss']),
+                        'profit_target': _optional_float(signal_row['profit_target']),
+                        'position_size_pct': signal_row['position_size_pct'],
+                        'atr': signal_row['atr'],
+                        'time_stop_date': signal_row['time_stop_date'] if pd.notna(signal_row.get('time_stop_date')) else None,
+                        'is_live': True
+                    }
+                    for signal_row in latest.to_dict('records')
+                }, None
         except Exception as e:
-            st.warning(f"Could not load saved signals: {e}")
+            return {}, str(e)
 
-    return None
+    return {}, None
 
 
 def get_saved_signal_for_commodity(commodity):
     """Get saved signal for a specific commodity"""
-    signals_df = load_saved_signals()
-
-    if signals_df is not None:
-        commodity_signals = signals_df[signals_df['commodity'] == commodity]
-        if len(commodity_signals) > 0:
-            signal_row = commodity_signals.iloc[-1]  # Get most recent
-
-            return {
-                'date': signal_row['date'],
-                'signal': signal_row['signal'],
-                'confidence': signal_row['confidence'],
-                'prediction': signal_row['prediction'],
-                'percentile': signal_row['percentile'],
-                'current_price': signal_row['current_price'],
-                'stop_loss': signal_row['stop_loss'] if signal_row['stop_loss'] != '' else None,
-                'profit_target': signal_row['profit_target'] if signal_row['profit_target'] != '' else None,
-                'position_size_pct': signal_row['position_size_pct'],
-                'atr': signal_row['atr'],
-                'time_stop_date': signal_row['time_stop_date'] if pd.notna(signal_row.get('time_stop_date')) else None,
-                'is_live': True
-            }
-
-    return None
-
-
-@st.cache_data
-def load_validation_results(results_path):
-    """Load walk-forward validation results"""
-    df = pd.read_csv(results_path)
-    return df
-
-
-@st.cache_data
-def load_validation_trades(trades_path):
-    """Load walk-forward validation trades"""
-    df = pd.read_csv(trades_path)
-
-    # Handle different file formats (corn vs soybean)
-    if 'entry_date' in df.columns:
-        # Corn format - has detailed trade info
-        df['entry_date'] = pd.to_datetime(df['entry_date'])
-        df['exit_date'] = pd.to_datetime(df['exit_date'])
-
-        # Add period column based on entry_date year
-        df['period'] = df['entry_date'].apply(lambda x:
-            '2014-2015' if x.year in [2014, 2015] else
-            '2016-2017' if x.year in [2016, 2017] else
-            '2018-2019' if x.year in [2018, 2019] else
-            '2020-2021' if x.year in [2020, 2021] else
-            '2022-2023' if x.year in [2022, 2023] else
-            '2024-2025'
-        )
-
-        # Map final_r to pnl_r for consistency
-        if 'final_r' in df.columns:
-            df['pnl_r'] = df['final_r']
-    else:
-        # Soybean format - simplified format with period already included
-        df['date'] = pd.to_datetime(df['date'])
-        # Create dummy columns for compatibility
-        df['entry_date'] = df['date']
-        df['exit_date'] = df['date']
-        df['direction'] = df['signal'].apply(lambda x: 'LONG' if x == 1 else 'SHORT')
-        df['entry_price'] = 0  # Not available in this format
-        df['exit_price'] = 0
-        df['pnl_r'] = df['strategy_return'] * 100  # Convert to R-like format
-        df['exit_reason'] = 'N/A'
-        df['days_held'] = 0
-
-    return df
+    signals, error = load_saved_signals()
+    if error:
+        st.warning(f"Could not load saved signals: {error}")
+    return signals.get(commodity)
 
 
-@st.cache_data
-def load_market_data(data_path):
-    """Load latest market data"""
-    df = pd.read_csv(data_path)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date').reset_index(drop=True)
+def load_validation_results(results_path, parquet_path):
+    """Load walk-forward validation results"""
+    df = read_validation_file(results_path, parquet_path, RESULTS_COLUMNS)
     return df
 
 
-@st.cache_resource
-def load_model(model_dir):
-    """Load trained model"""
-    try:
-        import joblib
-        model_path = model_dir / 'model_2024.pkl'
-        scaler_path = model_dir / 'scaler_2024.pkl'
-        imputer_path = model_dir / 'imputer_2024.pkl'
-
-        model = joblib.load(model_path)
-        scaler = joblib.load(scaler_path)
-        imputer = joblib.load(imputer_path)
-
-        feature_names = list(imputer.feature_names_in_) if hasattr(imputer, 'feature_names_in_') else None
-
-        return model, imputer, scaler, feature_names
-    except Exception as e:
-        st.warning(f"Could not load model: {e}")
-        return None, None, None, None
-
-
-def calculate_atr(prices, high=None, low=None, period=20):
-    """Calculate Average True Range"""
-    if high is not None and low is not None:
-        tr1 = high - low
-        tr2 = abs(high - prices.shift(1))
-        tr3 = abs(low - prices.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    else:
-        tr = prices.pct_change().abs().rolling(5).std() * prices
-
-    atr = tr.rolling(period).mean()
-    return atr
+def load_validation_trades(trades_path, parquet_path):
+    """Load walk-forward validation trades
 
+    Returns (trades_df, trades_by_period): all trades sorted by entry date,
+    and a dict mapping each validation period to its (sorted) trades.
+    """
+    return prepare_trades(read_validation_file(trades_path, parquet_path, TRADES_COLUMNS))
 
-def generate_live_signal(df, model, imputer, scaler, feature_cols, config):
-    """Generate live trading signal from current data"""
 
-    LONG_PERCENTILE = config['parameters']['thresholds']['long_percentile']
-    SHORT_PERCENTILE = config['parameters']['thresholds']['short_percentile']
-    ROLLING_WINDOW = config['parameters']['thresholds']['rolling_window']
-    R_PER_TRADE = config['parameters']['position_sizing']['r_per_trade']
-    ATR_MULTIPLIER = config['parameters']['stops']['atr_multiplier']
-    ATR_PERIOD = config['parameters']['stops']['atr_period']
-    PROFIT_TARGET_R = config['parameters']['profit_targets']['target_r']
-    TIME_STOP_DAYS = config['parameters']['stops']['time_stop_days']
+# Validation files per commodity (CSV and optional Parquet copies)
+VALIDATION_FILE_KEYS = ('validation_results', 'validation_trades',
+                        'validation_results_parquet', 'validation_trades_parquet')
 
-    recent_df = df.tail(150).copy()
 
-    features = recent_df[feature_cols].ffill()
-    features_imputed = imputer.transform(features)
-    features_scaled = scaler.transform(features_imputed)
+def validation_file_mtimes():
+    """Modification times (ns) of all validation files, 0 for missing ones
 
-    predictions = model.predict(features_scaled)
-    recent_df['prediction'] = predictions
-
-    recent_df['pred_percentile'] = recent_df['prediction'].rolling(
-        ROLLING_WINDOW, min_periods=20
-    ).apply(lambda x: pd.Series(x).rank(pct=True).iloc[-1])
-
-    if 'high' in recent_df.columns and 'low' in recent_df.columns:
-        recent_df['atr'] = calculate_atr(
-            recent_df['close'],
-            recent_df['high'],
-            recent_df['low'],
-            period=ATR_PERIOD
-        )
-    else:
-        recent_df['atr'] = calculate_atr(recent_df['close'], period=ATR_PERIOD)
-
-    today = recent_df[recent_df['pred_percentile'].notna()].iloc[-1]
+    Passed to the validation caches as part of the key, so they reload when
+    the model pipeline rewrites a file and never otherwise.
+    """
+    paths = [
+        config[key]
+        for config in COMMODITY_CONFIGS.values()
+        for key in (*VALIDATION_FILE_KEYS, 'dashboard_payload')
+    ]
+    return tuple(path.stat().st_mtime_ns if path.exists() else 0 for path in paths)
+
+
+@st.cache_data(persist='disk', show_spinner=False, max_entries=2)
+def read_all_validation_data(mtimes):
+    """Read validation data for every commodity in parallel
+
+    Persisted to disk so a restarted app unpickles the frames instead of
+    re-parsing the files. mtimes (validation_file_mtimes) only keys the cache.
+    """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            commodity: (
+                executor.submit(load_validation_results, config['validation_results'], config['validation_results_parquet']),
+                executor.submit(load_validation_trades, config['validation_trades'], config['validation_trades_parquet'])
+            )
+            for commodity, config in COMMODITY_CONFIGS.items()
+        }
+        return {
+            commodity: (results.result(), *trades.result())
+            for commodity, (results, trades) in futures.items()
+        }
 
-    signal = None
-    position_size = 0
-    percentile = today['pred_percentile']
 
-    if percentile >= LONG_PERCENTILE:
-        signal = 'LONG'
-        position_size = 1.0
-    elif percentile <= SHORT_PERCENTILE:
-        signal = 'SHORT'
-        position_size = 1.0
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_all_validation_data(mtimes):
+    """Validation data for every commodity, held in memory once per process
 
-    if signal:
-        current_price = today['close']
-        atr = today['atr']
-        stop_distance = ATR_MULTIPLIER * atr
+    Returns {commodity: (results_df, trades_df, trades_by_period)} so switching
+    commodity never waits on a file read (and reruns skip st.cache_data's
+    per-call unpickle).
+    """
+    return read_all_validation_data(mtimes)
 
-        if signal == 'LONG':
-            stop_loss = current_price - stop_distance
-            profit_target = current_price + (PROFIT_TARGET_R * stop_distance)
-        else:
-            stop_loss = current_price + stop_distance
-            profit_target = current_price - (PROFIT_TARGET_R * stop_distance)
 
-        position_size_r = R_PER_TRADE * position_size
+@st.cache_data(persist='disk', show_spinner=False, max_entries=4)
+def get_dashboard_payload(payload_path, source_paths, mtimes, _results_df, _trades_df, _trades_by_period):
+    """Precomputed dashboard aggregates
 
-        return {
-            'date': today['date'],
-            'signal': signal,
-            'confidence': percentile if signal == 'LONG' else (1 - percentile),
-            'prediction': today['prediction'],
-            'percentile': percentile,
-            'current_price': current_price,
-            'stop_loss': stop_loss,
-            'profit_target': profit_target,
-            'position_size_pct': position_size_r * 100,
-            'atr': atr,
-            'time_stop_date': today['date'] + timedelta(days=TIME_STOP_DAYS),
-            'is_live': True
-        }
-    else:
-        return {
-            'date': today['date'],
-            'signal': 'HOLD',
-            'confidence': 0,
-            'prediction': today['prediction'],
-            'percentile': percentile,
-            'current_price': today['close'],
-            'stop_loss': None,
-            'profit_target': None,
-            'position_size_pct': 0,
-            'atr': today['atr'],
-            'time_stop_date': None,
-            'is_live': True
-        }
+    Reads the JSON written by scripts/build_dashboard_payload.py when it is at
+    least as new as the validation files (source_paths), otherwise computes the
+    same payload from the validation data (the underscore arguments are not
+    hashed; the cache is keyed on the paths and the validation file mtimes).
+    """
+    payload = load_dashboard_payload(payload_path, source_paths)
+    if payload is None:
+        payload = build_dashboard_payload(_results_df, _trades_df, _trades_by_period)
+    return payload
 
 
-def get_most_recent_signal(trades_df):
+def get_most_recent_signal(payload):
     """Get the most recent trade as current signal indicator"""
 
-    # Get most recent trade
-    recent_trade = trades_df.iloc[-1]
+    recent_trade = payload['last_trade']
 
     return {
         'date': recent_trade['exit_date'],
@@ -415,18 +453,7 @@ def get_most_recent_signal(trades_df):
 def display_terminal_header():
     """Display terminal-style header"""
 
-    st.markdown("""
-<div class="terminal-box">
-╔═══════════════════════════════╗
-║                               ║
-║  AG FUTURES SIGNALS           ║
-║  HIGH CONVICTION MODELS       ║
-║                               ║
-║  CORN 🌽  |  SOYBEANS 🫘      ║
-║                               ║
-╚═══════════════════════════════╝
-</div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_BOX_HTML, unsafe_allow_html=True)
 
     current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     st.markdown(f"**SYSTEM TIME:** `{current_time}`")
@@ -435,201 +462,98 @@ def display_terminal_header():
     st.markdown("---")
 
 
-def display_recent_signal(commodity, signal):
+def display_recent_signal(view, signal):
     """Display most recent signal in terminal style"""
 
     is_live = signal.get('is_live', False)
 
     if is_live:
-        st.markdown(f"### {COMMODITY_CONFIGS[commodity]['emoji']} {COMMODITY_CONFIGS[commodity]['display_name']} - CURRENT SIGNAL 🔴 LIVE")
+        st.markdown(f"{view.header} CURRENT SIGNAL 🔴 LIVE")
     else:
-        st.markdown(f"### {COMMODITY_CONFIGS[commodity]['emoji']} {COMMODITY_CONFIGS[commodity]['display_name']} - MOST RECENT SIGNAL")
+        st.markdown(f"{view.header} MOST RECENT SIGNAL")
 
     if is_live:
         # Live signal display
         signal_date = signal['date'].strftime('%Y-%m-%d') if isinstance(signal['date'], pd.Timestamp) else signal['date']
-        signal_color = "LONG ↑" if signal['signal'] == 'LONG' else ("SHORT ↓" if signal['signal'] == 'SHORT' else "HOLD")
 
         if signal['signal'] == 'HOLD':
-            box_content = f"""
-<div class="terminal-box">
-╔══════════════════════════════════╗
-║ SIGNAL: HOLD
-║ DATE: {signal_date}
-║
-║ STATUS: NO ACTIVE SIGNAL
-║ PRICE: ${signal['current_price']:.2f}
-║ PRED: {signal['prediction']:+.2%}
-║ PCTL: {signal['percentile']:.1%}
-║   (NEED >90% OR <10%)
-║
-║ [WAITING FOR HIGH CONVICTION]
-╚══════════════════════════════════╝
-</div>
-            """
+            box_content = _HOLD_SIGNAL_TEMPLATE.format_map({**signal, 'signal_date': signal_date})
         else:
-            stop_str = f"${signal['stop_loss']:.2f}"
-            target_str = f"${signal['profit_target']:.2f}"
-            price_str = f"${signal['current_price']:.2f}"
-            time_stop_str = str(signal['time_stop_date'])[:10] if signal['time_stop_date'] else 'N/A'
-
-            box_content = f"""
-<div class="terminal-box">
-╔══════════════════════════════════╗
-║ ⚡ SIGNAL: {signal_color}
-║ DATE: {signal_date}
-║
-║ ENTRY: {price_str}
-║ STOP: {stop_str}
-║ TARGET: {target_str}
-║
-║ CONFIDENCE: {signal['confidence']:.1%}
-║ PERCENTILE: {signal['percentile']:.1%}
-║ POSITION: {signal['position_size_pct']:.1f}% equity
-║
-║ RISK/REWARD: 1:2
-║ TIME STOP: {time_stop_str}
-║   (10 days)
-║
-║ [🔴 LIVE SIGNAL]
-╚══════════════════════════════════╝
-</div>
-            """
+            box_content = _LIVE_SIGNAL_TEMPLATE.format_map({
+                **signal,
+                'signal_date': signal_date,
+                'signal_color': "LONG ↑" if signal['signal'] == 'LONG' else "SHORT ↓",
+                'time_stop': str(signal['time_stop_date'])[:10] if signal['time_stop_date'] else 'N/A'
+            })
     else:
-        # Historical signal display
-        entry_date = signal['entry_date'].strftime('%Y-%m-%d')
-        exit_date = signal['date'].strftime('%Y-%m-%d')
-
-        signal_color = "LONG ↑" if signal['signal'] == 'LONG' else "SHORT ↓"
-        pnl_display = f"{signal['pnl_r']:+.2f}R"
-
-        entry_px_str = f"${signal['entry_price']:.2f}"
-        exit_px_str = f"${signal['exit_price']:.2f}"
-
-        box_content = f"""
-<div class="terminal-box">
-╔══════════════════════════════════╗
-║ LAST TRADE: {signal_color}
-║ ENTRY: {entry_date}
-║ EXIT: {exit_date}
-║
-║ ENTRY PX: {entry_px_str}
-║ EXIT PX: {exit_px_str}
-║ PNL: {pnl_display}
-║
-║ EXIT RSN: {signal['exit_reason'].upper()}
-║ DAYS HELD: {signal['days_held']}
-║
-║ [HISTORICAL BACKTEST]
-╚══════════════════════════════════╝
-</div>
-        """
+        # Historical signal display (payload dates are already YYYY-MM-DD)
+        box_content = _HISTORICAL_SIGNAL_TEMPLATE.format_map({
+            **signal,
+            'signal_color': "LONG ↑" if signal['signal'] == 'LONG' else "SHORT ↓",
+            'exit_reason': signal['exit_reason'].upper()
+        })
 
     st.markdown(box_content, unsafe_allow_html=True)
 
 
-def display_ytd_performance(commodity, results_df, trades_df):
+def display_ytd_performance(view, ytd):
     """Display YTD performance metrics"""
 
-    st.markdown(f"### {COMMODITY_CONFIGS[commodity]['emoji']} {COMMODITY_CONFIGS[commodity]['display_name']} - YTD 2024-2025 PERFORMANCE")
-
-    # Get 2024-2025 period
-    ytd_results = results_df[results_df['period'] == '2024-2025'].iloc[0]
-    ytd_trades = trades_df[trades_df['period'] == '2024-2025'].copy()
-
-    # Extract metrics from available columns
-    total_trades = int(ytd_results['num_trades'])
-    win_rate = ytd_results['win_rate']
-    sharpe_ratio = ytd_results['sharpe']
-
-    # Calculate winning and losing trades
-    winning_trades = int(total_trades * win_rate)
-    losing_trades = total_trades - winning_trades
-
-    # Get average win/loss (column names differ between corn and soy)
-    avg_win_r = ytd_results['avg_win']
-    avg_loss_r = ytd_results['avg_loss']
-
-    # Calculate total PnL in R
-    # For soybean, total_return is already in R
-    # For corn, we need to calculate from avg_r * num_trades
-    if 'avg_r' in ytd_results:
-        # Corn format
-        total_pnl_r = ytd_results['avg_r'] * total_trades
-        # Calculate max drawdown from actual trades
-        ytd_sorted = ytd_trades.sort_values('entry_date')
-        ytd_sorted['cumulative_r'] = ytd_sorted['pnl_r'].cumsum()
-        running_max = ytd_sorted['cumulative_r'].expanding().max()
-        drawdown = ytd_sorted['cumulative_r'] - running_max
-        max_drawdown_r = abs(drawdown.min()) if len(drawdown) > 0 else 0
-    else:
-        # Soybean format (already in R)
-        total_pnl_r = ytd_results['total_return']
-        max_drawdown_r = abs(ytd_results['max_dd'])
-
-    # Metrics display
-    col1, col2, col3, col4 = st.columns(4)
+    st.markdown(f"{view.header} YTD 2024-2025 PERFORMANCE")
 
-    with col1:
-        st.metric("TOTAL PNL", f"{total_pnl_r:.2f}R")
-        st.metric("SHARPE", f"{sharpe_ratio:.2f}")
-
-    with col2:
-        st.metric("WIN RATE", f"{win_rate:.1%}")
-        st.metric("TRADES", f"{total_trades}")
-
-    with col3:
-        st.metric("AVG WIN", f"{avg_win_r:.2%}")
-        st.metric("AVG LOSS", f"{avg_loss_r:.2%}")
-
-    with col4:
-        st.metric("MAX DD", f"{max_drawdown_r:.2f}R")
-        st.metric("W/L", f"{winning_trades}/{losing_trades}")
+    # Metrics precomputed from the 2024-2025 period (see build_dashboard_payload)
+    st.markdown(_YTD_METRICS_TEMPLATE.format_map(ytd), unsafe_allow_html=True)
 
     st.markdown("---")
 
 
-def display_ytd_trades(commodity, trades_df):
+def display_ytd_trades(view, trades_df, trades_by_period):
     """Display YTD trade history"""
 
-    st.markdown(f"### {COMMODITY_CONFIGS[commodity]['emoji']} {COMMODITY_CONFIGS[commodity]['display_name']} - YTD 2024-2025 TRADE HISTORY")
+    st.markdown(f"{view.header} YTD 2024-2025 TRADE HISTORY")
 
-    ytd_trades = trades_df[trades_df['period'] == '2024-2025'].copy()
-    ytd_trades = ytd_trades.sort_values('entry_date', ascending=False)
+    # Newest first (groups are sorted ascending by entry_date); a commodity
+    # without YTD trades has no group and gets an empty table
+    ytd_trades = trades_by_period.get(YTD_PERIOD, trades_df.iloc[:0]).iloc[::-1]
 
     # Check if we have detailed trade data (corn format) or simplified (soy format)
-    has_prices = ytd_trades['entry_price'].max() > 0
+    has_prices = (ytd_trades['entry_price'] > 0).any()
 
     if has_prices:
         # Full trade detail available (corn format)
-        display_trades = ytd_trades[[
-            'entry_date', 'exit_date', 'direction',
-            'entry_price', 'exit_price', 'pnl_r',
-            'exit_reason', 'days_held'
-        ]].copy()
-
-        display_trades['entry_date'] = display_trades['entry_date'].dt.strftime('%Y-%m-%d')
-        display_trades['exit_date'] = display_trades['exit_date'].dt.strftime('%Y-%m-%d')
-        display_trades['entry_price'] = display_trades['entry_price'].apply(lambda x: f"${x:.2f}")
-        display_trades['exit_price'] = display_trades['exit_price'].apply(lambda x: f"${x:.2f}")
-        display_trades['pnl_r'] = display_trades['pnl_r'].apply(lambda x: f"{x:+.2f}R")
-
-        display_trades.columns = [
-            'ENTRY', 'EXIT', 'DIR',
-            'ENTRY_PX', 'EXIT_PX', 'PNL',
-            'EXIT_RSN', 'DAYS'
-        ]
+        display_trades = pd.DataFrame({
+            'ENTRY': ytd_trades['entry_date'],
+            'EXIT': ytd_trades['exit_date'],
+            'DIR': ytd_trades['direction'],
+            'ENTRY_PX': ytd_trades['entry_price'],
+            'EXIT_PX': ytd_trades['exit_price'],
+            'PNL': ytd_trades['pnl_r'],
+            'EXIT_RSN': ytd_trades['exit_reason'],
+            'DAYS': ytd_trades['days_held'],
+        })
+        column_config = {
+            'ENTRY': st.column_config.DateColumn(format='YYYY-MM-DD'),
+            'EXIT': st.column_config.DateColumn(format='YYYY-MM-DD'),
+            'ENTRY_PX': st.column_config.NumberColumn(format='$%.2f'),
+            'EXIT_PX': st.column_config.NumberColumn(format='$%.2f'),
+            'PNL': st.column_config.NumberColumn(format='%+.2fR'),
+        }
     else:
         # Simplified format (soy format) - show fewer columns
-        display_trades = ytd_trades[['entry_date', 'direction', 'pnl_r']].copy()
-
-        display_trades['entry_date'] = display_trades['entry_date'].dt.strftime('%Y-%m-%d')
-        display_trades['pnl_r'] = display_trades['pnl_r'].apply(lambda x: f"{x:+.2f}R")
-
-        display_trades.columns = ['DATE', 'DIRECTION', 'PNL']
+        display_trades = pd.DataFrame({
+            'DATE': ytd_trades['entry_date'],
+            'DIRECTION': ytd_trades['direction'],
+            'PNL': ytd_trades['pnl_r'],
+        })
+        column_config = {
+            'DATE': st.column_config.DateColumn(format='YYYY-MM-DD'),
+            'PNL': st.column_config.NumberColumn(format='%+.2fR'),
+        }
 
+    # Columns stay numeric/datetime; Streamlit formats them client side
     st.dataframe(
         display_trades,
+        column_config=column_config,
         use_container_width=True,
         hide_index=True
     )
@@ -637,161 +561,115 @@ def display_ytd_trades(commodity, trades_df):
     st.markdown("---")
 
 
-def display_all_periods_summary(commodity, results_df, trades_df):
+def display_all_periods_summary(view, results_df, payload):
     """Display summary of all validation periods"""
 
-    st.markdown(f"### 📊 {COMMODITY_CONFIGS[commodity]['display_name']} - ALL PERIODS WALK-FORWARD VALIDATION")
-
-    # Calculate total PnL for each period
-    display_results = results_df.copy()
-
-    # Handle different formats (corn vs soybean)
-    if 'avg_r' in display_results.columns:
-        # Corn format - calculate total R from avg_r * num_trades and max DD from trades
-        display_results['total_pnl_r'] = display_results['avg_r'] * display_results['num_trades']
-
-        # Calculate max DD for each period from actual trades
-        max_dd_list = []
-        for period in display_results['period']:
-            period_trades = trades_df[trades_df['period'] == period].sort_values('entry_date')
-            if len(period_trades) > 0:
-                period_trades['cumulative_r'] = period_trades['pnl_r'].cumsum()
-                running_max = period_trades['cumulative_r'].expanding().max()
-                drawdown = period_trades['cumulative_r'] - running_max
-                max_dd_list.append(abs(drawdown.min()))
-            else:
-                max_dd_list.append(0)
-        display_results['max_dd_r'] = max_dd_list
-    else:
-        # Soybean format - already has total_return in R
-        display_results['total_pnl_r'] = display_results['total_return']
-        display_results['max_dd_r'] = display_results['max_dd'].abs()
-
-    # Format for display
-    display_table = display_results[[
-        'period', 'num_trades', 'win_rate',
-        'total_pnl_r', 'sharpe', 'max_dd_r'
-    ]].copy()
-
-    display_table['win_rate'] = display_table['win_rate'].apply(lambda x: f"{x:.1%}")
-    display_table['total_pnl_r'] = display_table['total_pnl_r'].apply(lambda x: f"{x:+.2f}R")
-    display_table['sharpe'] = display_table['sharpe'].apply(lambda x: f"{x:.2f}")
-    display_table['max_dd_r'] = display_table['max_dd_r'].apply(lambda x: f"{x:.2f}R")
-
-    display_table.columns = [
-        'PERIOD', 'TRADES', 'WIN_RATE',
-        'TOTAL_PNL', 'SHARPE', 'MAX_DD'
-    ]
-
+    st.markdown(f"### 📊 {view.display_name} - ALL PERIODS WALK-FORWARD VALIDATION")
+
+    # Build the display table directly from the source columns; total PnL and
+    # max DD per period are precomputed (corn/soy formats differ). Win rate is
+    # a percentage number so the column can be formatted as "%"
+    periods = payload['periods']
+    display_table = pd.DataFrame({
+        'PERIOD': results_df['period'],
+        'TRADES': results_df['num_trades'],
+        'WIN_RATE': results_df['win_rate'] * 100,
+        'TOTAL_PNL': [periods[p]['total_pnl_r'] for p in results_df['period']],
+        'SHARPE': results_df['sharpe'],
+        'MAX_DD': [periods[p]['max_dd_r'] for p in results_df['period']],
+    })
+
+    # Columns stay numeric; Streamlit formats them client side
     st.dataframe(
         display_table,
+        column_config={
+            'WIN_RATE': st.column_config.NumberColumn(format='%.1f%%'),
+            'TOTAL_PNL': st.column_config.NumberColumn(format='%+.2fR'),
+            'SHARPE': st.column_config.NumberColumn(format='%.2f'),
+            'MAX_DD': st.column_config.NumberColumn(format='%.2fR'),
+        },
         use_container_width=True,
         hide_index=True
     )
 
     # Summary stats
     st.markdown("#### AGGREGATE STATISTICS")
-    col1, col2, col3, col4 = st.columns(4)
+    st.markdown(_AGGREGATE_METRICS_TEMPLATE.format_map(payload['aggregate']), unsafe_allow_html=True)
 
-    total_pnl_all = display_results['total_pnl_r'].sum()
-    avg_win_rate = display_results['win_rate'].mean()
-    avg_sharpe = display_results['sharpe'].mean()
-    worst_dd = display_results['max_dd_r'].max()
 
-    with col1:
-        st.metric("TOTAL PNL (ALL)", f"{total_pnl_all:.2f}R")
-    with col2:
-        st.metric("AVG WIN RATE", f"{avg_win_rate:.1%}")
-    with col3:
-        st.metric("AVG SHARPE", f"{avg_sharpe:.2f}")
-    with col4:
-        st.metric("WORST DD", f"{worst_dd:.2f}R")
+@st.fragment
+def render_commodity():
+    """Commodity selector and everything that depends on it
 
-
-def main():
-    """Main dashboard application"""
-
-    # Display header
-    display_terminal_header()
+    Runs as a fragment, so changing the selection reruns only this part of the
+    page (not the header, CSS and footer).
+    """
 
     # Select commodity
     commodity = st.selectbox(
         "SELECT COMMODITY:",
         options=['corn', 'soybean'],
-        format_func=lambda x: f"{COMMODITY_CONFIGS[x]['emoji']} {COMMODITY_CONFIGS[x]['display_name']}"
+        format_func=lambda x: COMMODITY_VIEWS[x].label
     )
 
     config = COMMODITY_CONFIGS[commodity]
-
-    # Check if live data is available
-    has_live_data = check_live_data_available(config)
+    view = COMMODITY_VIEWS[commodity]
 
     try:
         # Load validation data (always available)
-        with st.spinner(f"LOADING {config['display_name']} DATA..."):
-            results_df = load_validation_results(config['validation_results'])
-            trades_df = load_validation_trades(config['validation_trades'])
-
-        # Try to load saved signal first (for cloud deployment)
+        with st.spinner(f"LOADING {view.display_name} DATA..."):
+            mtimes = validation_file_mtimes()
+            results_df, trades_df, trades_by_period = load_all_validation_data(mtimes)[commodity]
+            payload = get_dashboard_payload(
+                config['dashboard_payload'],
+                tuple(config[key] for key in VALIDATION_FILE_KEYS),
+                mtimes, results_df, trades_df, trades_by_period
+            )
+
+        # Signal written offline by scripts/generate_signals_high_conviction.py
         signal = get_saved_signal_for_commodity(commodity)
 
         if signal:
             # Saved signal found
-            st.success(f"✓ SAVED SIGNAL LOADED | DATE: {signal['date'].strftime('%Y-%m-%d')} | {len(trades_df)} BACKTEST TRADES")
-        elif has_live_data:
-            # No saved signal, but we have data files - generate live signal
-            try:
-                with st.spinner("GENERATING LIVE SIGNAL..."):
-                    df = load_market_data(config['data_path'])
-
-                    with open(config['config_path'], 'r') as f:
-                        model_config = json.load(f)
-
-                    model, imputer, scaler, feature_names = load_model(config['model_dir'])
-
-                    if model is not None and feature_names is not None:
-                        signal = generate_live_signal(df, model, imputer, scaler, feature_names, model_config)
-                        st.success(f"✓ LIVE DATA LOADED | LATEST: {df['date'].max().strftime('%Y-%m-%d')} | {len(trades_df)} BACKTEST TRADES")
-                    else:
-                        st.warning("Model files not available - showing historical data only")
-                        signal = get_most_recent_signal(trades_df)
-            except Exception as e:
-                st.warning(f"Could not generate live signal: {e} - showing historical data")
-                signal = get_most_recent_signal(trades_df)
+            st.success(f"✓ SAVED SIGNAL LOADED | DATE: {signal['date'].strftime('%Y-%m-%d')} | {payload['num_trades']} BACKTEST TRADES")
         else:
-            # No saved signal and no data files - show historical
-            signal = get_most_recent_signal(trades_df)
-            st.success(f"✓ DATA LOADED | {len(trades_df)} TRADES | PERIODS: 2014-2025")
+            # No saved signal - show the last backtest trade
+            signal = get_most_recent_signal(payload)
+            st.success(f"✓ DATA LOADED | {payload['num_trades']} TRADES | PERIODS: 2014-2025")
 
         st.markdown("---")
 
         # Display signal (live or historical)
-        display_recent_signal(commodity, signal)
+        display_recent_signal(view, signal)
 
         st.markdown("---")
 
         # Display YTD performance
-        display_ytd_performance(commodity, results_df, trades_df)
+        display_ytd_performance(view, payload['ytd'])
 
         # Display YTD trades
-        display_ytd_trades(commodity, trades_df)
+        display_ytd_trades(view, trades_df, trades_by_period)
 
         # Display all periods summary
-        display_all_periods_summary(commodity, results_df, trades_df)
+        display_all_periods_summary(view, results_df, payload)
 
     except Exception as e:
         st.error(f"❌ ERROR: {str(e)}")
         st.exception(e)
 
+
+def main():
+    """Main dashboard application"""
+
+    # Display header
+    display_terminal_header()
+
+    # Commodity panels (isolated fragment)
+    render_commodity()
+
     # Footer
     st.markdown("---")
-    st.markdown("""
-<div class="terminal-box">
-╔═══════════════════════════════════════════════════════════════════════════════╗
-║  ⚠️  HISTORICAL BACKTEST DATA | NOT FINANCIAL ADVICE                         ║
-╚═══════════════════════════════════════════════════════════════════════════════╝
-</div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == '__main__':